@@ -109,10 +109,10 @@ mesh::Mesh build_tet(MPI_Comm comm, const std::array<Eigen::Vector3d, 2>& p,
   std::int64_t cell = 0;
   for (std::int64_t i = range_c[0]; i < range_c[1]; ++i)
   {
-    const int iz = i / (nx * ny);
-    const int j = i % (nx * ny);
-    const int iy = j / nx;
-    const int ix = j % nx;
+    const std::int64_t iz = i / (nx * ny);
+    const std::int64_t j = i % (nx * ny);
+    const std::int64_t iy = j / nx;
+    const std::int64_t ix = j % nx;
 
     const std::int64_t v0 = iz * (nx + 1) * (ny + 1) + iy * (nx + 1) + ix;
     const std::int64_t v1 = v0 + 1;
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """Simple built-in mesh generation module"""
 
+import functools
 import typing
 
 import numpy
@@ -17,6 +18,49 @@ __all__ = [
     "BoxMesh", "UnitCubeMesh"
 ]
 
+# Corner points of the unit square and unit cube
+_UNIT_SQUARE_POINTS = numpy.array([[0.0, 0.0, 0.0], [1.0, 1.0, 0.0]], dtype=numpy.float64)
+_UNIT_CUBE_POINTS = numpy.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]], dtype=numpy.float64)
+
+
+@functools.lru_cache(maxsize=None)
+def _coordinate_element(cell_type: str, gdim: int):
+    """Return the (immutable) UFL coordinate element for a cell type and
+    geometric dimension"""
+    return ufl.VectorElement("Lagrange", cell_type, 1, dim=gdim)
+
+
+@functools.lru_cache(maxsize=None)
+def _coordinate_map(cell_type: str, gdim: int):
+    """Return the compiled coordinate map for a cell type and geometric
+    dimension. The map is shared between all meshes of the same type."""
+    return fem.create_coordinate_map(ufl.Mesh(_coordinate_element(cell_type, gdim)))
+
+
+# Built-in mesh generators, keyed by topological dimension. All
+# generators take the arguments (comm, points, n, cmap, ghost_mode, ...).
+_FACTORY = {
+    1: lambda comm, points, n, cmap, ghost_mode: cpp.generation.IntervalMesh.create(
+        comm, n, points, cmap, ghost_mode),
+    2: cpp.generation.RectangleMesh.create,
+    3: cpp.generation.BoxMesh.create
+}
+
+
+def _create_mesh(comm, tdim: int, cell_type: str, points, n, ghost_mode, *args):
+    """Create a mesh with a built-in generator and attach a UFL domain
+
+    A new UFL domain is created for each mesh since the mesh is
+    attached to it, but the coordinate element and map are shared.
+
+    """
+    domain = ufl.Mesh(_coordinate_element(cell_type, tdim))
+    cmap = _coordinate_map(cell_type, tdim)
+    mesh = _FACTORY[tdim](comm, points, n, cmap, ghost_mode, *args)
+    domain._ufl_cargo = mesh
+    mesh._ufl_domain = domain
+    return mesh
+
 
 def IntervalMesh(comm, nx: int, points: list, ghost_mode=cpp.mesh.GhostMode.shared_facet):
     """Create an interval mesh
@@ -32,12 +76,7 @@ def IntervalMesh(comm, nx: int, points: list, ghost_mode=cpp.mesh.GhostMode.shar
     ghost_mode
 
     """
-    domain = ufl.Mesh(ufl.VectorElement("Lagrange", "interval", 1))
-    cmap = fem.create_coordinate_map(domain)
-    mesh = cpp.generation.IntervalMesh.create(comm, nx, points, cmap, ghost_mode)
-    domain._ufl_cargo = mesh
-    mesh._ufl_domain = domain
-    return mesh
+    return _create_mesh(comm, 1, "interval", points, nx, ghost_mode)
 
 
 def UnitIntervalMesh(comm, nx, ghost_mode=cpp.mesh.GhostMode.shared_facet):
@@ -70,12 +109,7 @@ def RectangleMesh(comm, points: typing.List[numpy.array], n: list, cell_type=cpp
         Direction of diagonal
 
     """
-    domain = ufl.Mesh(ufl.VectorElement("Lagrange", cpp.mesh.to_string(cell_type), 1))
-    cmap = fem.create_coordinate_map(domain)
-    mesh = cpp.generation.RectangleMesh.create(comm, points, n, cmap, ghost_mode, diagonal)
-    domain._ufl_cargo = mesh
-    mesh._ufl_domain = domain
-    return mesh
+    return _create_mesh(comm, 2, cpp.mesh.to_string(cell_type), points, n, ghost_mode, diagonal)
 
 
 def UnitSquareMesh(comm, nx, ny, cell_type=cpp.mesh.CellType.triangle,
@@ -94,9 +128,7 @@ def UnitSquareMesh(comm, nx, ny, cell_type=cpp.mesh.CellType.triangle,
         Direction of diagonal
 
     """
-    return RectangleMesh(comm, [numpy.array([0.0, 0.0, 0.0]),
-                                numpy.array([1.0, 1.0, 0.0])], [nx, ny], cell_type, ghost_mode,
-                         diagonal)
+    return RectangleMesh(comm, list(_UNIT_SQUARE_POINTS), [nx, ny], cell_type, ghost_mode, diagonal)
 
 
 def BoxMesh(comm, points: typing.List[numpy.array], n: list,
@@ -114,12 +146,7 @@ def BoxMesh(comm, points: typing.List[numpy.array], n: list,
         List of cells in each direction
 
     """
-    domain = ufl.Mesh(ufl.VectorElement("Lagrange", cpp.mesh.to_string(cell_type), 1))
-    cmap = fem.create_coordinate_map(domain)
-    mesh = cpp.generation.BoxMesh.create(comm, points, n, cmap, ghost_mode)
-    domain._ufl_cargo = mesh
-    mesh._ufl_domain = domain
-    return mesh
+    return _create_mesh(comm, 3, cpp.mesh.to_string(cell_type), points, n, ghost_mode)
 
 
 def UnitCubeMesh(comm, nx, ny, nz, cell_type=cpp.mesh.CellType.tetrahedron,
@@ -138,5 +165,4 @@ def UnitCubeMesh(comm, nx, ny, nz, cell_type=cpp.mesh.CellType.tetrahedron,
         Number of cells in "z" direction
 
     """
-    return BoxMesh(comm, [numpy.array([0.0, 0.0, 0.0]), numpy.array(
-        [1.0, 1.0, 1.0])], [nx, ny, nz], cell_type, ghost_mode)
+    return BoxMesh(comm, list(_UNIT_CUBE_POINTS), [nx, ny, nz], cell_type, ghost_mode)
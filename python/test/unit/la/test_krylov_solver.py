@@ -59,12 +59,15 @@ def test_krylov_samg_solver_elasticity():
     def build_nullspace(V, x):
         """Function to build null space for 2D elasticity"""
 
-        # Create list of vectors for null space
-        nullspace_basis = [x.copy() for i in range(3)]
+        # Create list of vectors for null space (same layout as x, but
+        # without copying its entries)
+        nullspace_basis = [x.duplicate() for i in range(3)]
 
         with ExitStack() as stack:
             vec_local = [stack.enter_context(x.localForm()) for x in nullspace_basis]
             basis = [np.asarray(x) for x in vec_local]
+            for b in basis:
+                b[:] = 0.0
 
             # Build null space basis
             dofs = [V.sub(i).dofmap.list.array for i in range(2)]
@@ -78,7 +81,7 @@ def test_krylov_samg_solver_elasticity():
         null_space.orthonormalize()
         return null_space
 
-    def amg_solve(N, method):
+    def build_problem(N):
         # Elasticity parameters
         E = 1.0e9
         nu = 0.3
@@ -131,6 +134,9 @@ def test_krylov_samg_solver_elasticity():
         # Test that basis is orthonormal
         assert null_space.is_orthonormal()
 
+        return mesh, A, b, u
+
+    def amg_solve(mesh, A, b, u, method):
         # Create PETSC smoothed aggregation AMG preconditioner, and
         # create CG solver
         solver = PETSc.KSP().create(mesh.mpi_comm)
@@ -157,9 +163,11 @@ def test_krylov_samg_solver_elasticity():
     #    methods.append("ml_amg")
 
     # Test iteration count with increasing mesh size for each
-    # preconditioner
-    for method in methods:
-        for N in [8, 16, 32, 64]:
+    # preconditioner. The system is assembled once per mesh size and
+    # re-used for all preconditioners.
+    for N in [8, 16, 32, 64]:
+        mesh, A, b, u = build_problem(N)
+        for method in methods:
             print("Testing method '{}' with {} x {} mesh".format(method, N, N))
-            niter = amg_solve(N, method)
+            niter = amg_solve(mesh, A, b, u, method)
             assert niter < 18
@@ -144,6 +144,14 @@ def test_UFLDomain(interval, square, rectangle, cube, box):
     _check_ufl_domain(box)
 
 
+def test_UFLDomain_not_shared():
+    mesh0 = UnitSquareMesh(MPI.COMM_WORLD, 2, 2)
+    mesh1 = UnitSquareMesh(MPI.COMM_WORLD, 2, 2)
+    assert mesh0.ufl_domain() is not mesh1.ufl_domain()
+    assert mesh0.ufl_domain().ufl_cargo() is mesh0
+    assert mesh1.ufl_domain().ufl_cargo() is mesh1
+
+
 def test_UnitSquareMeshDistributed():
     """Create mesh of unit square."""
     mesh = UnitSquareMesh(MPI.COMM_WORLD, 5, 7)